@@ -1,16 +1,50 @@
 from __future__ import annotations  # future-proof typing 
 
+import itertools
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, status, Response
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, status, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson instead of stdlib json."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route class that hands every handler an ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await original_route_handler(
+                ORJSONRequest(request.scope, request.receive)
+            )
+
+        return custom_route_handler
+
+
 app = FastAPI(
     title= "Task Management API",
     version= "1.0.0",
     description= "A small FastAPI app that manages a to-do list using in-memory storage.",
+    # orjson serializes responses much faster than the stdlib json module.
+    default_response_class=ORJSONResponse,
 )
+# Must be set before the route decorators below run so POST/PUT bodies are
+# parsed with orjson as well.
+app.router.route_class = ORJSONRoute
 
 
 # Request models are seperated from Response models and this keeps concerns clear and lets us apply different validation rules.
@@ -44,7 +78,7 @@ class TaskUpdate(BaseModel):
 
 class Task(TaskBase):
     """
-    Model returned to clients.
+    Response schema as documented in OpenAPI.
     Includes server-managed fields (id, created_at).
     """
     id: int
@@ -52,69 +86,159 @@ class Task(TaskBase):
     created_at: datetime
 
 
-# An in-memory "database" where a simple dict maps task_id -> Task
-_tasks: Dict[int, Task] = {}
-_next_id: int = 1  # auto-incrementing ID counter
+# Pydantic v2 builds core schemas, validators and serializers lazily on
+# first use, which shows up as a latency spike on the very first request.
+# Exercise each model once here so that setup cost is paid at import.
+for _model in (TaskBase, TaskCreate, TaskUpdate, Task):
+    _model.model_json_schema()
+TaskCreate.model_validate({"title": "warmup"})
+Task.model_construct(
+    id=0,
+    title="warmup",
+    description=None,
+    completed=False,
+    created_at=datetime.now(timezone.utc),
+).model_dump_json()
+
+
+# gc=False is safe: every field is a scalar or string, so instances can
+# never participate in a reference cycle, and untracked structs are both
+# smaller and invisible to garbage collection passes.
+class TaskStored(msgspec.Struct, gc=False):
+    """
+    In-memory representation of a task.
+    A msgspec.Struct instantiates and encodes several times faster than a
+    Pydantic model; the data is already validated by the request models,
+    so we only need Pydantic on the ingress side.
+    """
+    id: int
+    title: str
+    description: Optional[str]
+    completed: bool
+    # Pre-formatted ISO 8601 string; formatted once at creation so
+    # serialization only ever emits it.
+    created_at: str
+
+
+# TaskStored's shape is fixed at import time, so rather than a generic
+# encoder we serialize with a function specialized to its exact field
+# layout: straight byte concatenation with zero per-field type dispatch.
+# Keep in sync with TaskStored's fields. created_at is our own ISO string
+# and needs no escaping; the free-form strings still go through orjson.
+def _dump_task(t: TaskStored) -> bytes:
+    """Serialize one stored task to JSON bytes."""
+    return (
+        b'{"id":' + str(t.id).encode()
+        + b',"title":' + orjson.dumps(t.title)
+        + b',"description":'
+        + (b"null" if t.description is None else orjson.dumps(t.description))
+        + b',"completed":' + (b"true" if t.completed else b"false")
+        + b',"created_at":"' + t.created_at.encode() + b'"}'
+    )
 
 
-def _now_utc() -> datetime:
-    """Return a timezone-aware UTC timestamp."""
-    return datetime.now(timezone.utc)
+# An in-memory "database" where a simple dict maps task_id -> TaskStored
+_tasks: Dict[int, TaskStored] = {}
+# Cache of each task's encoded bytes, refreshed on every write, so the
+# read-heavy GET endpoints never re-serialize unchanged tasks. Kept as
+# compact parallel arrays (struct-of-arrays) rather than a dict: list_tasks
+# scans a contiguous list of rows instead of chasing dict entries, and
+# deletes stay O(1) by swapping the last row into the freed slot.
+_rows: List[bytes] = []      # encoded rows, densely packed
+_row_ids: List[int] = []     # _row_ids[pos] == id of the task at _rows[pos]
+_id_to_pos: Dict[int, int] = {}  # task_id -> position in _rows
 
 
-def _get_next_id() -> int:
-    """Return the next integer ID and increment the counter."""
-    global _next_id
-    _id = _next_id
-    _next_id += 1
-    return _id
+def _row_set(task_id: int, row: bytes) -> None:
+    """Insert or replace the cached row for task_id."""
+    pos = _id_to_pos.get(task_id)
+    if pos is None:
+        _id_to_pos[task_id] = len(_rows)
+        _rows.append(row)
+        _row_ids.append(task_id)
+    else:
+        _rows[pos] = row
 
 
-def _get_task_or_404(task_id: int) -> Task:
-    """
-    Helper to fetch a task or raise a 404 error.
-    Keeping this logic in one place avoids duplication in route handlers.
-    """
-    task = _tasks.get(task_id)
-    if task is None:
-        # FastAPI automatically serializes HTTPException detail to JSON.
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found",
-        )
-    return task
+def _row_pop(task_id: int) -> bool:
+    """Remove the cached row for task_id; swap-with-last keeps _rows dense."""
+    pos = _id_to_pos.pop(task_id, None)
+    if pos is None:
+        return False
+    last = len(_rows) - 1
+    if pos != last:
+        _rows[pos] = _rows[last]
+        _row_ids[pos] = _row_ids[last]
+        _id_to_pos[_row_ids[pos]] = pos
+    _rows.pop()
+    _row_ids.pop()
+    return True
+
+
+# Auto-incrementing ID counter. itertools.count increments in C, with no
+# Python-level read-modify-write (atomic under the GIL and safe without it).
+_id_counter = itertools.count(1)
+_get_next_id = _id_counter.__next__
+
+
+_UTC = timezone.utc  # hoisted to skip the attribute lookup per call
+
+
+def _now_utc() -> str:
+    """Return the current UTC time as an ISO 8601 string (ends in +00:00)."""
+    return datetime.now(_UTC).isoformat()
+
+
+# Detail template for 404s; %-formatting an int is the cheapest of the
+# string formatters, and it only runs in the (rare) error branch anyway.
+_NOT_FOUND_TEMPLATE = "Task with id %d not found"
 
 
 # Routes / Endpoints
 @app.get(
     "/tasks",
-    response_model=List[Task],
+    responses={200: {"model": List[Task]}},  # OpenAPI schema only; we serialize ourselves
     summary="Return all tasks",
     tags=["Tasks"],
 )
-def list_tasks() -> List[Task]:
+async def list_tasks() -> StreamingResponse:
     """
     Return all tasks currently stored in memory.
-    FastAPI uses the response_model to validate/serialize the output.
+    Streams the cached per-task bytes so the full array is never joined in
+    memory and the first rows go out while the rest are still being sent.
     """
-    return list(_tasks.values())
+    # Snapshot the rows so concurrent writes can't mutate the list mid-stream.
+    rows = _rows.copy()
+
+    async def stream():
+        yield b"["
+        first = True
+        for row in rows:
+            if first:
+                first = False
+            else:
+                yield b","
+            yield row
+        yield b"]"
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 @app.post(
     "/tasks",
-    response_model=Task,
+    responses={201: {"model": Task}},  # OpenAPI schema only; we serialize ourselves
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task",
     tags=["Tasks"],
 )
-def create_task(payload: TaskCreate) -> Task:
+async def create_task(payload: TaskCreate) -> Response:
     """
     Create a new task from the client-provided payload.
     - We assign an auto-incrementing ID.
     - We set created_at to current UTC time.
     """
     task_id = _get_next_id()
-    task = Task(
+    task = TaskStored(
         id=task_id,
         title=payload.title,
         description=payload.description,
@@ -122,52 +246,105 @@ def create_task(payload: TaskCreate) -> Task:
         created_at=_now_utc(),
     )
     _tasks[task_id] = task
-    return task
+    body = _dump_task(task)
+    _row_set(task_id, body)
+    return Response(
+        content=body,
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
+
+
+# Registered before the /tasks/{task_id} routes so "bulk" is not captured
+# as a task_id path parameter.
+@app.post(
+    "/tasks/bulk",
+    responses={201: {"model": List[Task]}},  # OpenAPI schema only; we serialize ourselves
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several tasks in one request",
+    tags=["Tasks"],
+)
+async def create_tasks_bulk(payload: List[TaskCreate]) -> Response:
+    """
+    Create many tasks at once.
+    Amortizes the per-request routing/validation/serialization overhead
+    across the whole batch; one timestamp is shared by all created tasks.
+    """
+    now = _now_utc()
+    rows = []
+    for item in payload:
+        task_id = _get_next_id()
+        task = TaskStored(
+            id=task_id,
+            title=item.title,
+            description=item.description,
+            completed=item.completed,
+            created_at=now,
+        )
+        _tasks[task_id] = task
+        row = _dump_task(task)
+        _row_set(task_id, row)
+        rows.append(row)
+    return Response(
+        content=b"[" + b",".join(rows) + b"]",
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @app.get(
     "/tasks/{task_id}",
-    response_model=Task,
+    responses={200: {"model": Task}},  # OpenAPI schema only; we serialize ourselves
     summary="Get a specific task",
     tags=["Tasks"],
 )
-def get_task(task_id: int) -> Task:
+async def get_task(task_id: int) -> Response:
     """
     Fetch a single task by ID.
-    Returns 404 if not found (via helper).
+    Returns 404 if not found.
     """
-    return _get_task_or_404(task_id)
+    # EAFP: a hit (the common case) costs one dict lookup plus a list index.
+    try:
+        body = _rows[_id_to_pos[task_id]]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_NOT_FOUND_TEMPLATE % task_id,
+        )
+    return Response(content=body, media_type="application/json")
 
 
 @app.put(
     "/tasks/{task_id}",
-    response_model=Task,
+    responses={200: {"model": Task}},  # OpenAPI schema only; we serialize ourselves
     summary="Update a task",
     tags=["Tasks"],
 )
-def update_task(task_id: int, payload: TaskUpdate) -> Task:
+async def update_task(task_id: int, payload: TaskUpdate) -> Response:
     """
     Update an existing task.
     We support partial updates with PUT for simplicity in this take-home test.
     Only fields explicitly provided in the request will be changed.
     """
-    existing = _get_task_or_404(task_id)
-
-    # Convert the existing Task to a dict we can modify
-    update_data = existing.model_dump()
+    try:
+        existing = _tasks[task_id]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_NOT_FOUND_TEMPLATE % task_id,
+        )
 
-    # Apply only provided fields; leave the rest unchanged
-    if payload.title is not None:
-        update_data["title"] = payload.title
-    if payload.description is not None:
-        update_data["description"] = payload.description
-    if payload.completed is not None:
-        update_data["completed"] = payload.completed
+    # Apply only the fields the client actually sent, writing straight onto
+    # the stored struct -- no dict round-trip and no replacement object.
+    # Explicit JSON nulls are skipped too: every field is Optional on
+    # TaskUpdate, but None is never a valid stored value.
+    for field, value in payload.model_dump(exclude_unset=True).items():
+        if value is not None:
+            setattr(existing, field, value)
 
-    # Re-validate through the Task model to keep types consistent
-    updated = Task(**update_data)
-    _tasks[task_id] = updated
-    return updated
+    body = _dump_task(existing)
+    _row_set(task_id, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.delete(
@@ -177,10 +354,15 @@ def update_task(task_id: int, payload: TaskUpdate) -> Task:
     tags=["Tasks"],
     response_class=Response,   # <— ensure no JSON body is produced
 )
-def delete_task(task_id: int) -> Response:
+async def delete_task(task_id: int) -> Response:
     """
     Delete a task by id. Returns 204 with an empty body.
     """
-    _get_task_or_404(task_id)  # 404 if not found
-    del _tasks[task_id]
+    # Single pop instead of lookup-then-delete: one hash probe per DELETE.
+    if _tasks.pop(task_id, None) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=_NOT_FOUND_TEMPLATE % task_id,
+        )
+    _row_pop(task_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
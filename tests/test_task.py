@@ -2,6 +2,7 @@
 End-to-end tests for the FastAPI to-do app using FastAPI's TestClient.
 """
 
+import itertools
 import os, sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import main
@@ -20,7 +21,11 @@ def reset_in_memory_store():
     Clears the in-memory database and resets the auto-incrementing ID.
     """
     main._tasks.clear()
-    main._next_id = 1
+    main._rows.clear()
+    main._row_ids.clear()
+    main._id_to_pos.clear()
+    main._id_counter = itertools.count(1)
+    main._get_next_id = main._id_counter.__next__
     yield
 
 def test_list_tasks_initially_empty():
@@ -61,6 +66,21 @@ def test_create_defaults_completed_false_when_omitted():
     assert res.json()["completed"] is False
 
 
+def test_bulk_create_assigns_sequential_ids():
+    payload = [
+        {"title": "One"},
+        {"title": "Two", "description": "second", "completed": True},
+    ]
+    res = client.post("/tasks/bulk", json=payload)
+    assert res.status_code == 201
+    data = res.json()
+    assert [t["id"] for t in data] == [1, 2]
+    assert data[1]["completed"] is True
+
+    # Both tasks are retrievable individually afterwards
+    assert client.get("/tasks/2").json()["title"] == "Two"
+
+
 def test_update_task_partial_fields_only():
     # Seed a task
     client.post("/tasks", json={"title": "Study", "description": "Ch. 1", "completed": False})